@@ -1,31 +1,344 @@
 #!/usr/bin/env python3
 """mcp_server MCP server"""
 
+import argparse
+import asyncio
 import os
-import sys
+import re
+import time
+from contextlib import asynccontextmanager
 from datetime import date, datetime
-from typing import Annotated, Optional
+from functools import lru_cache
+from typing import Annotated, Any, Callable, Optional
+from urllib.parse import urlsplit
 from zoneinfo import ZoneInfo
 
 import httpx
+import orjson
 from arcade_mcp_server import Context, MCPApp, mcp_app as arcade_mcp_app_module
 from arcade_mcp_server.auth import Reddit
 from arcade_mcp_server.worker import create_arcade_mcp as _create_arcade_mcp
-from fastapi.middleware.cors import CORSMiddleware
 from arcade_mcp_server import types as arcade_mcp_types
 
+_ciso8601_parse: Optional[Callable[[str], datetime]]
+try:
+    from ciso8601 import parse_datetime as _ciso8601_parse
+except ImportError:  # optional speedup, see the "speedups" extra
+    _ciso8601_parse = None
+
 # Temporarily pin protocol to match the UI SDK (sdk supports up to 2025-03-26).
 arcade_mcp_types.LATEST_PROTOCOL_VERSION = "2025-03-26"
 
+_GEOCODE_URL = "https://geocoding-api.open-meteo.com/v1/search"
+_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Request constants built once instead of on every tool call.
+_DAILY_COLUMNS = (
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "precipitation_probability_max",
+    "precipitation_sum",
+    "weathercode",
+)
+_DAILY_VARS = ",".join(_DAILY_COLUMNS)
+_IMPERIAL_PARAMS = {
+    "temperature_unit": "fahrenheit",
+    "windspeed_unit": "mph",
+    "precipitation_unit": "inch",
+}
+_REDDIT_USER_AGENT = "mcp_server-mcp-server"
+_REDDIT_PARAMS = {"limit": 5}  # read-only; httpx does not mutate params
+_SUBREDDIT_STRIP_RE = re.compile(r"r/|\s")
+
+# ISO 3166-1 alpha-2 codes (plus the widely used user-assigned XK for Kosovo), so
+# malformed country codes are rejected locally instead of after a round-trip.
+_ISO_ALPHA2 = frozenset(
+    """
+    AD AE AF AG AI AL AM AO AQ AR AS AT AU AW AX AZ
+    BA BB BD BE BF BG BH BI BJ BL BM BN BO BQ BR BS BT BV BW BY BZ
+    CA CC CD CF CG CH CI CK CL CM CN CO CR CU CV CW CX CY CZ
+    DE DJ DK DM DO DZ
+    EC EE EG EH ER ES ET
+    FI FJ FK FM FO FR
+    GA GB GD GE GF GG GH GI GL GM GN GP GQ GR GS GT GU GW GY
+    HK HM HN HR HT HU
+    ID IE IL IM IN IO IQ IR IS IT
+    JE JM JO JP
+    KE KG KH KI KM KN KP KR KW KY KZ
+    LA LB LC LI LK LR LS LT LU LV LY
+    MA MC MD ME MF MG MH MK ML MM MN MO MP MQ MR MS MT MU MV MW MX MY MZ
+    NA NC NE NF NG NI NL NO NP NR NU NZ
+    OM
+    PA PE PF PG PH PK PL PM PN PR PS PT PW PY
+    QA
+    RE RO RS RU RW
+    SA SB SC SD SE SG SH SI SJ SK SL SM SN SO SR SS ST SV SX SY SZ
+    TC TD TF TG TH TJ TK TL TM TN TO TR TT TV TW TZ
+    UA UG UM US UY UZ
+    VA VC VE VG VI VN VU
+    WF WS
+    XK
+    YE YT
+    ZA ZM ZW
+    """.split()
+)
+
+
+def _norm_upper(value: str) -> str:
+    """Trim and upper-case a code argument such as a country or currency code."""
+    value = value.strip()
+    return value.upper() if value else value
+
+
+def _geocode_query(city: str, country_code: Optional[str] = None) -> str:
+    """Build get_weather's geocode query as "City Name[,CC]".
+
+    Open-Meteo matches names case-insensitively, so the name is title-cased and
+    whitespace-collapsed to give differently typed spellings one cache entry.
+    """
+    query = " ".join(city.split()).title()
+    if country_code:
+        query = f"{query},{_norm_upper(country_code)}"
+    return query
+
+
+# One pooled HTTP client shared by every tool so upstream calls reuse keep-alive
+# connections instead of paying a TCP + TLS handshake per invocation.
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOCK = asyncio.Lock()
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        async with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.AsyncClient(
+                    timeout=10,
+                    limits=httpx.Limits(max_keepalive_connections=50, max_connections=200),
+                    http2=True,
+                )
+    return _CLIENT
+
+
+async def _close_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+# Cities whose geocode lookups (as issued by get_weather without a country code)
+# are cached at startup.
+# Together with a HEAD to the forecast host this also opens pooled connections
+# to both hosts get_weather hits back to back.
+_PREWARM_CITIES = (
+    "London",
+    "New York",
+    "Tokyo",
+    "Paris",
+    "Berlin",
+    "Singapore",
+    "Sydney",
+    "Los Angeles",
+)
+
+
+async def _warm_connections() -> None:
+    """Pre-fill the geocode cache and open weather connections; failures are ignored."""
+    client = await _get_client()
+    await asyncio.gather(
+        client.head(_FORECAST_URL),
+        *(
+            _cached_get_json(_GEOCODE_URL, {"name": _geocode_query(city), "count": 1})
+            for city in _PREWARM_CITIES
+        ),
+        return_exceptions=True,
+    )
+
+
+# Seconds to keep upstream JSON, per host. Geocoding and holidays are effectively
+# static; current weather and exchange rates go stale quickly.
+_CACHE_TTL = {
+    "geocoding-api.open-meteo.com": 86400,
+    "date.nager.at": 86400,
+    "open.er-api.com": 3600,
+    "api.open-meteo.com": 300,
+}
+_CACHE_MAX_ENTRIES = 1024
+# Maps (url, params) to (expiry on the monotonic clock, decoded JSON).
+_cache: dict[tuple, tuple[float, Any]] = {}
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+async def _fetch_json(url: str, params: Optional[dict]) -> Any:
+    client = await _get_client()
+    resp = await client.get(url, params=params)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+
+async def _cached_get_json(url: str, params: Optional[dict] = None) -> Any:
+    """GET a JSON document, serving repeats from an in-memory TTL cache.
+
+    Concurrent misses for the same request share a single upstream fetch.
+    Callers must treat the returned object as read-only since it is shared.
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    ttl = _CACHE_TTL.get(urlsplit(url).hostname or "", 0)
+    hit = _cache.get(key)
+    if hit is not None and time.monotonic() < hit[0]:
+        return hit[1]
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_json(url, params))
+        _inflight[key] = task
+
+        def _finished(done: asyncio.Task) -> None:
+            _inflight.pop(key, None)
+            if not done.cancelled():
+                # Mark the error as seen even if every waiter was cancelled.
+                done.exception()
+
+        task.add_done_callback(_finished)
+    # Shield so one cancelled caller does not abort the fetch for the others.
+    data = await asyncio.shield(task)
+
+    if ttl > 0:
+        now = time.monotonic()
+        # Re-insert refreshed keys at the end so eviction order stays oldest-first.
+        _cache.pop(key, None)
+        if len(_cache) >= _CACHE_MAX_ENTRIES:
+            for stale in [k for k, (expires, _) in _cache.items() if expires <= now]:
+                del _cache[stale]
+            while len(_cache) >= _CACHE_MAX_ENTRIES:
+                del _cache[next(iter(_cache))]
+        _cache[key] = (now + ttl, data)
+    return data
+
+
+class _CORSMiddleware:
+    """Pure-ASGI CORS for a fixed set of trusted origins, with credentials allowed.
+
+    Behaves like Starlette's CORSMiddleware configured with allow_methods=["*"],
+    allow_headers=["*"] and allow_credentials=True, but every response header is
+    encoded once up front. Requests only scan the raw scope headers and add
+    prebuilt tuples, with no Headers/MutableHeaders/Response objects.
+    """
+
+    _ALLOW_METHODS = (b"DELETE", b"GET", b"HEAD", b"OPTIONS", b"PATCH", b"POST", b"PUT")
+    _PREFLIGHT_VARY = b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers"
+
+    def __init__(self, app, allow_origins=(), expose_headers=()):
+        self.app = app
+        self._allow_origins = {origin.encode("latin-1") for origin in allow_origins}
+        self._allow_methods = frozenset(self._ALLOW_METHODS)
+        credentials = (b"access-control-allow-credentials", b"true")
+        self._simple_headers = [credentials]
+        if expose_headers:
+            self._simple_headers.append(
+                (b"access-control-expose-headers", ", ".join(expose_headers).encode("latin-1"))
+            )
+        self._preflight_headers = [
+            (b"vary", self._PREFLIGHT_VARY),
+            (b"access-control-allow-methods", b", ".join(self._ALLOW_METHODS)),
+            (b"access-control-max-age", b"600"),
+            credentials,
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin, request_method, request_headers)
+            return
+
+        extra_headers = self._simple_headers
+        if origin in self._allow_origins:
+            extra_headers = [*extra_headers, (b"access-control-allow-origin", origin)]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                # Fold Origin into any Vary the app already set, as a single header.
+                headers = []
+                vary = []
+                for name, value in message.get("headers", ()):
+                    if name.lower() == b"vary":
+                        vary.append(value)
+                    else:
+                        headers.append((name, value))
+                vary.append(b"Origin")
+                message["headers"] = [*headers, *extra_headers, (b"vary", b", ".join(vary))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, send, origin, request_method, request_headers):
+        headers = self._preflight_headers
+        failures = []
+        if origin in self._allow_origins:
+            headers = [*headers, (b"access-control-allow-origin", origin)]
+        else:
+            failures.append(b"origin")
+        if request_method not in self._allow_methods:
+            failures.append(b"method")
+        if request_headers is not None:
+            # With credentials a literal "*" is not honoured, so mirror the request.
+            headers = [*headers, (b"access-control-allow-headers", request_headers)]
+
+        if failures:
+            status, body = 400, b"Disallowed CORS " + b", ".join(failures)
+        else:
+            status, body = 200, b"OK"
+        headers = [
+            *headers,
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
 # Patch the FastAPI app factory used by MCPApp to inject CORS support for the OAP web UI.
 def create_arcade_mcp_with_cors(*args, **kwargs):
     fastapi_app = _create_arcade_mcp(*args, **kwargs)
+
+    # The app uses a custom lifespan, so shutdown event handlers would never fire;
+    # wrap the lifespan instead to release pooled connections on shutdown.
+    arcade_lifespan = fastapi_app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan_with_client(app):
+        async with arcade_lifespan(app) as state:
+            warmup = asyncio.create_task(_warm_connections())
+            try:
+                yield state
+            finally:
+                warmup.cancel()
+                await _close_client()
+
+    fastapi_app.router.lifespan_context = lifespan_with_client
     fastapi_app.add_middleware(
-        CORSMiddleware,
+        _CORSMiddleware,
         allow_origins=["http://localhost:3000"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
         expose_headers=["mcp-session-id"],
     )
     return fastapi_app
@@ -33,7 +346,12 @@ def create_arcade_mcp_with_cors(*args, **kwargs):
 
 arcade_mcp_app_module.create_arcade_mcp = create_arcade_mcp_with_cors
 
-app = MCPApp(name="mcp_server", version="1.0.0", log_level="DEBUG")
+# DEBUG logging formats full request/response payloads; opt in via MCP_LOG_LEVEL.
+app = MCPApp(
+    name="mcp_server",
+    version="1.0.0",
+    log_level=os.environ.get("MCP_LOG_LEVEL", "INFO").upper(),
+)
 
 
 @app.tool
@@ -64,26 +382,22 @@ async def get_posts_in_subreddit(
 ) -> dict:
     """Get posts from a specific subreddit"""
     # Normalize the subreddit name
-    subreddit = subreddit.lower().replace("r/", "").replace(" ", "")
+    subreddit = _SUBREDDIT_STRIP_RE.sub("", subreddit.lower())
 
     # Prepare the httpx request
     # OAuth token is injected into the context at runtime.
     # LLMs and MCP clients cannot see or access your OAuth tokens.
     oauth_token = context.get_auth_token_or_empty()
-    headers = {
-        "Authorization": f"Bearer {oauth_token}",
-        "User-Agent": "mcp_server-mcp-server",
-    }
-    params = {"limit": 5}
+    headers = {"Authorization": f"Bearer {oauth_token}", "User-Agent": _REDDIT_USER_AGENT}
     url = f"https://oauth.reddit.com/r/{subreddit}/hot"
 
     # Make the request
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
+    client = await _get_client()
+    response = await client.get(url, headers=headers, params=_REDDIT_PARAMS)
+    response.raise_for_status()
 
-        # Return the response
-        return response.json()
+    # Return the response
+    return orjson.loads(response.content)
 
 
 @app.tool
@@ -101,39 +415,32 @@ async def get_weather(
     Fetch current weather for a city using the Open-Meteo APIs (geocoding + forecast).
     No API key or auth required.
     """
-    query = city.strip()
-    if country_code:
-        query = f"{query},{country_code.strip()}"
+    query = _geocode_query(city, country_code)
 
     # Open-Meteo uses metric; convert to imperial if requested
     want_imperial = units.lower().startswith("imp")
 
     # Geocode the city to lat/lon
-    geocode_url = "https://geocoding-api.open-meteo.com/v1/search"
-    weather_url = "https://api.open-meteo.com/v1/forecast"
-    async with httpx.AsyncClient(timeout=10) as client:
-        geocode_resp = await client.get(geocode_url, params={"name": query, "count": 1})
-        geocode_resp.raise_for_status()
-        geocode_data = geocode_resp.json()
-        results = geocode_data.get("results") or []
-        if not results:
-            return {"error": f"Could not find location for '{query}'"}
-        location = results[0]
-        lat = location["latitude"]
-        lon = location["longitude"]
-        name = location.get("name", city)
-        country = location.get("country", country_code or "")
-
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current_weather": True,
-        }
-        weather_resp = await client.get(weather_url, params=params)
-        weather_resp.raise_for_status()
-        weather_data = weather_resp.json()
+    geocode_data = await _cached_get_json(_GEOCODE_URL, {"name": query, "count": 1})
+    # Open-Meteo omits "results" entirely when nothing matches.
+    try:
+        location = geocode_data["results"][0]
+    except (KeyError, IndexError, TypeError):
+        return {"error": f"Could not find location for '{query}'"}
+    lat = location["latitude"]
+    lon = location["longitude"]
+    name = location.get("name") or city
+    country = location.get("country") or country_code or ""
+
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "current_weather": True,
+    }
+    weather_data = await _cached_get_json(_FORECAST_URL, params)
 
-    current = weather_data.get("current_weather", {}) or {}
+    # Copy before adding imperial fields: the cached payload is shared.
+    current = dict(weather_data.get("current_weather") or {})
     # Normalize units if imperial requested
     temp_c = current.get("temperature")
     wind_ms = current.get("windspeed")
@@ -156,6 +463,12 @@ async def get_weather(
     }
 
 
+@lru_cache(maxsize=512)
+def _zone(name: str) -> ZoneInfo:
+    """Resolve an IANA timezone name, memoizing successful lookups."""
+    return ZoneInfo(name)
+
+
 @app.tool
 def get_time(
     timezone: Annotated[Optional[str], "IANA timezone, e.g. 'UTC' or 'Asia/Tokyo'"] = None,
@@ -163,7 +476,7 @@ def get_time(
     """Get the current time in a specific timezone (defaults to UTC)."""
     tz_name = (timezone or "UTC").strip()
     try:
-        tzinfo = ZoneInfo(tz_name)
+        tzinfo = _zone(tz_name)
     except Exception:
         return {"error": f"Unknown timezone '{tz_name}'"}
     now = datetime.now(tzinfo)
@@ -175,6 +488,16 @@ def get_time(
     }
 
 
+def _parse_datetime(raw: str) -> datetime:
+    """Parse an ISO 8601 datetime, using ciso8601 when it is installed."""
+    if _ciso8601_parse is not None:
+        try:
+            return _ciso8601_parse(raw)
+        except ValueError:
+            pass  # ciso8601 rejects a few forms the stdlib accepts
+    return datetime.fromisoformat(raw)
+
+
 @app.tool
 def convert_timezone(
     datetime_str: Annotated[str, "Datetime in ISO format, e.g. '2025-10-12 09:00'"],
@@ -183,17 +506,17 @@ def convert_timezone(
 ) -> dict:
     """Convert a datetime from one timezone to another."""
     try:
-        source_tz = ZoneInfo(from_tz.strip())
+        source_tz = _zone(from_tz.strip())
     except Exception:
         return {"error": f"Unknown timezone '{from_tz}'"}
     try:
-        target_tz = ZoneInfo(to_tz.strip())
+        target_tz = _zone(to_tz.strip())
     except Exception:
         return {"error": f"Unknown timezone '{to_tz}'"}
 
     raw = datetime_str.strip()
     try:
-        parsed = datetime.fromisoformat(raw)
+        parsed = _parse_datetime(raw)
     except ValueError:
         return {
             "error": (
@@ -222,27 +545,23 @@ async def currency_exchange(
     amount: Annotated[float, "Amount in the source currency"] = 1.0,
 ) -> dict:
     """Convert between currencies using open.er-api.com (no API key required)."""
-    base = from_currency.strip().upper()
-    quote = to_currency.strip().upper()
+    base = _norm_upper(from_currency)
+    quote = _norm_upper(to_currency)
     if len(base) != 3 or len(quote) != 3:
         return {"error": "Currency codes must be 3-letter ISO codes (e.g. USD, JPY)."}
     if amount < 0:
         return {"error": "Amount must be non-negative."}
 
     url = f"https://open.er-api.com/v6/latest/{base}"
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        data = resp.json()
+    data = await _cached_get_json(url)
 
     if data.get("result") != "success":
         return {"error": "Currency exchange API error.", "details": data}
 
-    rates = data.get("rates") or {}
-    if quote not in rates:
+    rate = (data.get("rates") or {}).get(quote)
+    if rate is None:
         return {"error": f"Unsupported currency '{quote}'"}
 
-    rate = rates[quote]
     converted = round(amount * rate, 4)
     return {
         "from": base,
@@ -268,9 +587,9 @@ async def geocode(
 ) -> dict:
     """Geocode a city name to lat/lon using Open-Meteo."""
     normalized_city = city.strip()
-    normalized_country_code = country_code.strip().upper() if country_code else None
+    normalized_country_code = _norm_upper(country_code) if country_code else None
     if "," in normalized_city:
-        parts = [part.strip() for part in normalized_city.split(",") if part.strip()]
+        parts = [part for part in (p.strip() for p in normalized_city.split(",")) if part]
         if parts:
             normalized_city = parts[0]
             if not normalized_country_code and len(parts) >= 2:
@@ -285,11 +604,7 @@ async def geocode(
     if language:
         params["language"] = language.strip()
 
-    geocode_url = "https://geocoding-api.open-meteo.com/v1/search"
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(geocode_url, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    data = await _cached_get_json(_GEOCODE_URL, params)
 
     results = data.get("results") or []
     formatted = []
@@ -335,55 +650,37 @@ async def weather_forecast(
     params = {
         "latitude": latitude,
         "longitude": longitude,
-        "daily": ",".join(
-            [
-                "temperature_2m_max",
-                "temperature_2m_min",
-                "precipitation_probability_max",
-                "precipitation_sum",
-                "weathercode",
-            ]
-        ),
+        "daily": _DAILY_VARS,
         "forecast_days": forecast_days,
         "timezone": (timezone or "auto").strip(),
     }
     if want_imperial:
-        params.update(
-            {
-                "temperature_unit": "fahrenheit",
-                "windspeed_unit": "mph",
-                "precipitation_unit": "inch",
-            }
-        )
+        params.update(_IMPERIAL_PARAMS)
 
-    weather_url = "https://api.open-meteo.com/v1/forecast"
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(weather_url, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    data = await _cached_get_json(_FORECAST_URL, params)
 
     daily = data.get("daily") or {}
     daily_units = data.get("daily_units") or {}
     times = daily.get("time") or []
-    def value_at(values, idx):
-        if not values or idx >= len(values):
-            return None
-        return values[idx]
-
-    forecast = []
-    for idx, day in enumerate(times):
-        forecast.append(
-            {
-                "date": day,
-                "temperature_max": value_at(daily.get("temperature_2m_max"), idx),
-                "temperature_min": value_at(daily.get("temperature_2m_min"), idx),
-                "precipitation_probability_max": value_at(
-                    daily.get("precipitation_probability_max"), idx
-                ),
-                "precipitation_sum": value_at(daily.get("precipitation_sum"), idx),
-                "weathercode": value_at(daily.get("weathercode"), idx),
-            }
-        )
+    # Look each column up once, padded with None to the number of days, and zip
+    # them into rows rather than indexing every column per day.
+    num_days = len(times)
+    columns = []
+    for var in _DAILY_COLUMNS:
+        values = daily.get(var) or []
+        columns.append(values[:num_days] + [None] * (num_days - len(values)))
+
+    forecast = [
+        {
+            "date": day,
+            "temperature_max": temp_max,
+            "temperature_min": temp_min,
+            "precipitation_probability_max": precip_prob,
+            "precipitation_sum": precip_sum,
+            "weathercode": code,
+        }
+        for day, temp_max, temp_min, precip_prob, precip_sum, code in zip(times, *columns)
+    ]
 
     return {
         "location": {"latitude": latitude, "longitude": longitude},
@@ -400,15 +697,14 @@ async def public_holidays(
     year: Annotated[Optional[int], "Year, e.g. 2025"] = None,
 ) -> dict:
     """Fetch public holidays for a given country and year using Nager.Date."""
-    code = country_code.strip().upper()
+    code = _norm_upper(country_code)
     if len(code) != 2:
         return {"error": "Country code must be a 2-letter ISO code (e.g. JP)."}
+    if code not in _ISO_ALPHA2:
+        return {"error": f"Unknown country code '{code}'"}
     target_year = year or date.today().year
     url = f"https://date.nager.at/api/v3/PublicHolidays/{target_year}/{code}"
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        holidays = resp.json()
+    holidays = await _cached_get_json(url)
 
     return {
         "country_code": code,
@@ -418,23 +714,28 @@ async def public_holidays(
         "source": "date.nager.at (no API key required)",
     }
 
+
+def _parse_args() -> argparse.Namespace:
+    """Parse transport/host/port flags; host/port default from MCP_HOST/MCP_PORT."""
+    parser = argparse.ArgumentParser(description="Run the mcp_server MCP server.")
+    parser.add_argument("transport", nargs="?", default="stdio", help="stdio (default) or http")
+    parser.add_argument("--host", default=os.environ.get("MCP_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("MCP_PORT", "8000")))
+    return parser.parse_args()
+
+
 # Run with specific transport
 if __name__ == "__main__":
-    # Decide transport/host/port from flags or environment so Docker can bind to 0.0.0.0.
-    # Default transport keeps the existing "stdio" behaviour.
-    transport = "stdio"
-    if len(sys.argv) > 1 and not sys.argv[1].startswith("-"):
-        transport = sys.argv[1]
-
-    host = os.environ.get("MCP_HOST", "127.0.0.1")
-    port = int(os.environ.get("MCP_PORT", "8000"))
-
-    # Lightweight flag parsing for --host/--port
-    for idx, arg in enumerate(sys.argv[1:], start=1):
-        if arg == "--host" and idx + 1 < len(sys.argv):
-            host = sys.argv[idx + 1]
-        if arg == "--port" and idx + 1 < len(sys.argv):
-            port = int(sys.argv[idx + 1])
+    args = _parse_args()
+
+    # Use the libuv-based event loop when available; app.run() starts its loop
+    # with asyncio.run(), which picks up the policy.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     # Run the server
-    app.run(transport=transport, host=host, port=port)
+    app.run(transport=args.transport, host=args.host, port=args.port)
@@ -0,0 +1,142 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from mcp_server import server
+
+URL = "https://api.open-meteo.com/v1/forecast"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(server, "_cache", {})
+    monkeypatch.setattr(server, "_inflight", {})
+
+
+class _Upstream:
+    """MockTransport handler that counts requests and can hold them until released."""
+
+    def __init__(self, status=200):
+        self.status = status
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, request):
+        self.calls += 1
+        await self.release.wait()
+        return httpx.Response(self.status, json={"query": dict(request.url.params)})
+
+
+def _install(monkeypatch, upstream):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    monkeypatch.setattr(server, "_CLIENT", client)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_fetch(monkeypatch):
+    upstream = _Upstream()
+    upstream.release.clear()
+    _install(monkeypatch, upstream)
+
+    pending = asyncio.gather(*(server._cached_get_json(URL, {"q": "x"}) for _ in range(10)))
+    await asyncio.sleep(0.01)
+    upstream.release.set()
+    results = await pending
+
+    assert upstream.calls == 1
+    assert all(r == {"query": {"q": "x"}} for r in results)
+    # Served from the cache afterwards.
+    await server._cached_get_json(URL, {"q": "x"})
+    assert upstream.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_are_not_cached(monkeypatch):
+    upstream = _Upstream(status=500)
+    upstream.release.clear()
+    _install(monkeypatch, upstream)
+
+    pending = asyncio.gather(
+        *(server._cached_get_json(URL, {"q": "x"}) for _ in range(5)), return_exceptions=True
+    )
+    await asyncio.sleep(0.01)
+    upstream.release.set()
+    results = await pending
+
+    assert upstream.calls == 1
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert server._cache == {}
+    assert server._inflight == {}
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await server._cached_get_json(URL, {"q": "x"})
+    assert upstream.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_abort_shared_fetch(monkeypatch):
+    upstream = _Upstream()
+    upstream.release.clear()
+    _install(monkeypatch, upstream)
+
+    first = asyncio.ensure_future(server._cached_get_json(URL, {"q": "x"}))
+    second = asyncio.ensure_future(server._cached_get_json(URL, {"q": "x"}))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0)
+    upstream.release.set()
+
+    assert await second == {"query": {"q": "x"}}
+    assert first.cancelled()
+    assert upstream.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_capped_and_evicts_oldest(monkeypatch):
+    monkeypatch.setattr(server, "_CACHE_MAX_ENTRIES", 3)
+    upstream = _Upstream()
+    _install(monkeypatch, upstream)
+
+    def key(n):
+        return (URL, (("q", n),))
+
+    await server._cached_get_json(URL, {"q": 0})
+    await server._cached_get_json(URL, {"q": 1})
+    # Expire entry 0 and refetch it; the refreshed entry becomes the newest.
+    _, data = server._cache[key(0)]
+    server._cache[key(0)] = (time.monotonic() - 1, data)
+    await server._cached_get_json(URL, {"q": 0})
+    await server._cached_get_json(URL, {"q": 2})
+    assert list(server._cache) == [key(1), key(0), key(2)]
+
+    await server._cached_get_json(URL, {"q": 3})
+    assert list(server._cache) == [key(0), key(2), key(3)]
+
+    for n in range(4, 10):
+        await server._cached_get_json(URL, {"q": n})
+        assert len(server._cache) == 3
+    assert upstream.calls == 11
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_geocode_serves_any_spelling(monkeypatch):
+    requests = []
+
+    def upstream(request):
+        requests.append(request)
+        if request.url.host == "geocoding-api.open-meteo.com":
+            location = {"latitude": 51.5, "longitude": -0.1, "name": "London"}
+            return httpx.Response(200, json={"results": [location]})
+        return httpx.Response(200, json={"current_weather": {"temperature": 10.0}})
+
+    _install(monkeypatch, upstream)
+    await server._warm_connections()
+    warmed = len(requests)
+
+    for city in ("London", "london", "  LONDON "):
+        result = await server.get_weather(city)
+        assert result["location"]["name"] == "London"
+    assert all(r.url.host == "api.open-meteo.com" for r in requests[warmed:])
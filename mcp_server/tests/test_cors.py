@@ -0,0 +1,78 @@
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from mcp_server.server import _CORSMiddleware
+
+ALLOWED = "http://localhost:3000"
+
+
+def _endpoint(request):
+    return PlainTextResponse("hello", headers={"Vary": "Accept-Encoding"})
+
+
+def _client():
+    app = Starlette(routes=[Route("/", _endpoint)])
+    app.add_middleware(_CORSMiddleware, allow_origins=[ALLOWED], expose_headers=["mcp-session-id"])
+    return TestClient(app)
+
+
+def _preflight(client, origin, method="POST"):
+    return client.options(
+        "/",
+        headers={
+            "Origin": origin,
+            "Access-Control-Request-Method": method,
+            "Access-Control-Request-Headers": "content-type, mcp-session-id",
+        },
+    )
+
+
+def test_preflight_allowed_origin():
+    resp = _preflight(_client(), ALLOWED)
+    assert resp.status_code == 200
+    assert resp.text == "OK"
+    assert resp.headers["access-control-allow-origin"] == ALLOWED
+    assert resp.headers["access-control-allow-credentials"] == "true"
+    assert resp.headers["access-control-allow-headers"] == "content-type, mcp-session-id"
+    assert "POST" in resp.headers["access-control-allow-methods"]
+
+
+def test_preflight_disallowed_origin():
+    resp = _preflight(_client(), "http://evil.example")
+    assert resp.status_code == 400
+    assert resp.text == "Disallowed CORS origin"
+    assert "access-control-allow-origin" not in resp.headers
+
+
+def test_preflight_disallowed_method():
+    resp = _preflight(_client(), ALLOWED, method="FOO")
+    assert resp.status_code == 400
+    assert resp.text == "Disallowed CORS method"
+
+    resp = _preflight(_client(), "http://evil.example", method="FOO")
+    assert resp.text == "Disallowed CORS origin, method"
+
+
+def test_simple_request_allowed_origin():
+    resp = _client().get("/", headers={"Origin": ALLOWED})
+    assert resp.text == "hello"
+    assert resp.headers["access-control-allow-origin"] == ALLOWED
+    assert resp.headers["access-control-allow-credentials"] == "true"
+    assert resp.headers["access-control-expose-headers"] == "mcp-session-id"
+    assert resp.headers.get_list("vary") == ["Accept-Encoding, Origin"]
+
+
+def test_simple_request_disallowed_origin():
+    resp = _client().get("/", headers={"Origin": "http://evil.example"})
+    assert resp.text == "hello"
+    assert "access-control-allow-origin" not in resp.headers
+    assert resp.headers.get_list("vary") == ["Accept-Encoding, Origin"]
+
+
+def test_simple_request_without_origin():
+    resp = _client().get("/")
+    assert resp.text == "hello"
+    assert "access-control-allow-origin" not in resp.headers
+    assert resp.headers.get_list("vary") == ["Accept-Encoding"]